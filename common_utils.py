@@ -1,9 +1,15 @@
+import aiohttp
+import asyncio
+import re
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
-from pymongo import MongoClient
-from typing import List, Dict, Any
+from bs4 import BeautifulSoup, SoupStrainer
+from pymongo import MongoClient, UpdateOne
+from functools import lru_cache
+from typing import List, Dict, Any, NamedTuple
 import os
+import time
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 import urllib3
@@ -11,44 +17,221 @@ import urllib3
 # SSL 경고 억제
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# 워밍된 Lambda 컨테이너에서 keep-alive 연결을 재사용하기 위한 모듈 단위 세션
+_session = requests.Session()
+_session.headers.update(
+    {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+)
+# Lambda 하나가 보는 호스트 수는 적으므로 작은 커넥션 풀로 충분
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+
+def _request_page(
+    url: str,
+    timeout: int = 30,
+    etag: str = None,
+    last_modified: str = None,
+):
+    """웹 페이지를 동기적으로 요청하고 응답 객체를 반환
+
+    etag/last_modified가 주어지면 조건부 요청(If-None-Match/If-Modified-Since)을
+    보냅니다. 서버가 304 Not Modified를 응답하면 응답 객체를 그대로 반환하므로
+    호출하는 쪽에서 status_code를 확인해야 합니다.
+    """
+
+    print(f"🔍 [FETCH] 요청 시작: {url}")
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    # 모듈 단위 세션으로 연결을 재사용하는 HTTP 요청
+    response = _session.get(
+        url,
+        timeout=timeout,
+        verify=False,  # SSL 검증 비활성화
+        headers=headers,
+    )
+
+    if response.status_code == 304:
+        print(f"⏭️ [FETCH] 변경 없음 (304): {url}")
+        return response
+
+    if response.status_code != 200:
+        error_msg = f"페이지 요청 실패: {url}, 상태 코드: {response.status_code}"
+        print(f"❌ [FETCH] {error_msg}")
+        raise Exception(error_msg)
+
+    # 응답 크기 제한
+    if len(response.content) > 5 * 1024 * 1024:  # 5MB
+        error_msg = f"응답이 너무 큽니다: {len(response.content)} bytes"
+        print(f"⚠️ [FETCH] {error_msg}")
+        raise Exception(error_msg)
+
+    return response
+
+
+def _build_soup(response, strainer: SoupStrainer = None) -> BeautifulSoup:
+    """응답 본문을 BeautifulSoup 객체로 변환
+
+    bytes를 그대로 파서에 넘겨 str 복사본을 만들지 않습니다. 인코딩은
+    BeautifulSoup(UnicodeDammit)이 utf-8 → euc-kr/cp949 순으로 감지합니다.
+    파서는 C 구현인 lxml을 사용합니다. strainer를 주면 해당 부분 트리만
+    파싱해 객체 할당을 줄입니다.
+    """
+
+    return BeautifulSoup(response.content, "lxml", parse_only=strainer)
+
+
+def fetch_rss(
+    url: str, etag: str = None, last_modified: str = None, timeout: int = 30
+):
+    """RSS 피드 본문을 공용 세션으로 가져옴 (조건부 요청 지원)
+
+    feedparser.parse(url)는 매 호출마다 새 연결로 내려받으므로, 풀링된
+    모듈 세션으로 bytes만 가져와 파서에 넘기게 합니다. 반환값은
+    (body, etag, last_modified) 튜플이며 서버가 304를 응답하면 body가
+    None이고 기존 검증자를 그대로 돌려줍니다.
+    """
 
-def fetch_page(url: str, timeout: int = 30) -> BeautifulSoup:
+    response = _request_page(url, timeout, etag=etag, last_modified=last_modified)
+    if response.status_code == 304:
+        return None, etag, last_modified
+    return (
+        response.content,
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+    )
+
+
+def fetch_page(
+    url: str, timeout: int = 30, strainer: SoupStrainer = None
+) -> BeautifulSoup:
     """웹 페이지를 동기적으로 가져와 BeautifulSoup 객체로 반환"""
 
     try:
-        print(f"🔍 [FETCH] 요청 시작: {url}")
+        response = _request_page(url, timeout)
+        soup = _build_soup(response, strainer)
+        print(f"✅ [FETCH] 성공: {url}")
+        return soup
+
+    except requests.exceptions.Timeout:
+        error_msg = f"타임아웃: {url}"
+        print(f"❌ [FETCH] {error_msg}")
+        raise Exception(error_msg)
+    except Exception as e:
+        error_msg = f"페이지 요청 중 오류: {e}"
+        print(f"❌ [FETCH] {error_msg}")
+        raise Exception(error_msg)
+
+
+async def fetch_page_async(
+    session: aiohttp.ClientSession, url: str, timeout: int = 30
+) -> BeautifulSoup:
+    """공유 aiohttp 세션으로 웹 페이지를 비동기로 가져와 BeautifulSoup 객체로 반환
+
+    여러 사이트를 asyncio.gather로 동시에 가져올 때 사용합니다. 세션은 호출하는
+    쪽에서 만들어 재사용해야 연결 풀의 이점을 얻습니다.
+    """
+
+    try:
+        print(f"🔍 [FETCH] 비동기 요청 시작: {url}")
 
-        # requests를 사용한 단순한 HTTP 요청
-        response = requests.get(
+        async with session.get(
             url,
-            timeout=timeout,
-            verify=False,  # SSL 검증 비활성화
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            ssl=False,  # SSL 검증 비활성화
             headers={
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             },
-        )
+        ) as response:
+            if response.status != 200:
+                error_msg = f"페이지 요청 실패: {url}, 상태 코드: {response.status}"
+                print(f"❌ [FETCH] {error_msg}")
+                raise Exception(error_msg)
 
-        if response.status_code != 200:
-            error_msg = f"페이지 요청 실패: {url}, 상태 코드: {response.status_code}"
-            print(f"❌ [FETCH] {error_msg}")
-            raise Exception(error_msg)
+            content = await response.read()
 
         # 응답 크기 제한
-        if len(response.content) > 5 * 1024 * 1024:  # 5MB
-            error_msg = f"응답이 너무 큽니다: {len(response.content)} bytes"
+        if len(content) > 5 * 1024 * 1024:  # 5MB
+            error_msg = f"응답이 너무 큽니다: {len(content)} bytes"
             print(f"⚠️ [FETCH] {error_msg}")
             raise Exception(error_msg)
 
-        # 인코딩 처리
-        try:
-            html_text = response.content.decode("utf-8")
-        except UnicodeDecodeError:
-            try:
-                html_text = response.content.decode("euc-kr")
-            except UnicodeDecodeError:
-                html_text = response.content.decode("cp949", errors="replace")
+        soup = BeautifulSoup(content, "lxml")
+        print(f"✅ [FETCH] 비동기 요청 성공: {url}")
+        return soup
+
+    except aiohttp.ServerTimeoutError:
+        error_msg = f"타임아웃: {url}"
+        print(f"❌ [FETCH] {error_msg}")
+        raise Exception(error_msg)
+    except Exception as e:
+        error_msg = f"페이지 요청 중 오류: {e}"
+        print(f"❌ [FETCH] {error_msg}")
+        raise Exception(error_msg)
+
+
+
+# 워밍된 컨테이너에서 재사용하는 aiohttp 세션 (이벤트 루프 기준 지연 생성)
+_aiohttp_session: aiohttp.ClientSession = None
+_aiohttp_session_loop = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """모듈 단위 aiohttp 세션을 반환
 
-        soup = BeautifulSoup(html_text, "html.parser")
+    실행 중인 이벤트 루프에 묶인 세션을 지연 생성해 재사용합니다.
+    루프가 바뀌면(핸들러가 asyncio.run을 새로 호출한 경우) 새로 만들고,
+    핸들러 종료 시 닫지 않아 워밍된 컨테이너에서 TLS 연결이 유지됩니다.
+    """
+
+    global _aiohttp_session, _aiohttp_session_loop
+
+    loop = asyncio.get_running_loop()
+    if (
+        _aiohttp_session is None
+        or _aiohttp_session.closed
+        or _aiohttp_session_loop is not loop
+    ):
+        _aiohttp_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=20, ttl_dns_cache=300, keepalive_timeout=75
+            )
+        )
+        _aiohttp_session_loop = loop
+    return _aiohttp_session
+
+def fetch_page_conditional(url: str, scraper_type: str, timeout: int = 30):
+    """crawl_cache의 ETag/Last-Modified를 사용해 조건부로 페이지를 가져옴
+
+    변경 사항이 없으면(304 Not Modified) None을 반환하므로, 호출하는 쪽에서
+    "새로운 공지 없음"으로 바로 종료할 수 있습니다. 200 응답이면 새 검증자를
+    crawl_cache에 갱신하고 BeautifulSoup 객체를 반환합니다.
+    """
+
+    try:
+        cache = get_crawl_cache(scraper_type)
+        response = _request_page(
+            url,
+            timeout,
+            etag=cache.get("etag"),
+            last_modified=cache.get("last_modified"),
+        )
+
+        if response.status_code == 304:
+            return None
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            save_crawl_cache(scraper_type, etag, last_modified)
+
+        soup = _build_soup(response)
         print(f"✅ [FETCH] 성공: {url}")
         return soup
 
@@ -62,8 +245,79 @@ def fetch_page(url: str, timeout: int = 30) -> BeautifulSoup:
         raise Exception(error_msg)
 
 
-def get_recent_notices(collection_name: str) -> List[Dict[str, Any]]:
-    """MongoDB에서 최근 공지사항들을 가져옴"""
+def get_crawl_cache(scraper_type: str) -> Dict[str, Any]:
+    """crawl_cache 컬렉션에서 스크래퍼별 ETag/Last-Modified 캐시를 조회"""
+
+    try:
+        mongodb_uri = os.environ.get("MONGODB_URI")
+        mongodb_database = os.environ.get("DB_NAME")
+
+        if not mongodb_uri or not mongodb_database:
+            return {}
+
+        client = MongoClient(mongodb_uri)
+        db = client[mongodb_database]
+        entry = db["crawl_cache"].find_one({"scraper_type": scraper_type}, {"_id": 0})
+        client.close()
+        return entry or {}
+
+    except Exception as e:
+        # 캐시 조회 실패는 전체 요청으로 폴백하면 되므로 치명적이지 않음
+        print(f"⚠️ [CACHE] crawl_cache 조회 중 오류: {e}")
+        return {}
+
+
+def save_crawl_cache(scraper_type: str, etag: str, last_modified: str) -> bool:
+    """crawl_cache 컬렉션에 스크래퍼별 ETag/Last-Modified 캐시를 저장"""
+
+    try:
+        mongodb_uri = os.environ.get("MONGODB_URI")
+        mongodb_database = os.environ.get("DB_NAME")
+
+        if not mongodb_uri or not mongodb_database:
+            return False
+
+        client = MongoClient(mongodb_uri)
+        db = client[mongodb_database]
+        db["crawl_cache"].update_one(
+            {"scraper_type": scraper_type},
+            {"$set": {"etag": etag, "last_modified": last_modified}},
+            upsert=True,
+        )
+        client.close()
+        return True
+
+    except Exception as e:
+        print(f"⚠️ [CACHE] crawl_cache 저장 중 오류: {e}")
+        return False
+
+
+# 워밍된 Lambda 컨테이너에서 최근 공지사항 조회 결과를 재사용하기 위한 캐시
+# {collection_name: (만료 epoch, 조회 결과)}
+CACHE_TTL_SECONDS = 120
+_recent_notices_cache: Dict[str, Any] = {}
+
+
+# 중복 확인에는 title/link만 필요하므로 기본적으로 두 필드만 가져옴
+DEDUP_PROJECTION = {"title": 1, "link": 1, "_id": 0}
+
+
+def get_recent_notices(
+    collection_name: str,
+    refresh: bool = False,
+    projection: Dict[str, int] = DEDUP_PROJECTION,
+) -> List[Dict[str, Any]]:
+    """MongoDB에서 최근 공지사항들을 가져옴
+
+    워밍된 컨테이너에서는 CACHE_TTL_SECONDS 동안 조회 결과를 재사용합니다.
+    refresh=True면 캐시를 무시하고 새로 조회합니다. 기본 projection은
+    중복 확인에 쓰이는 title/link만 내려받아 대역폭을 줄입니다.
+    """
+
+    if not refresh:
+        cached = _recent_notices_cache.get(collection_name)
+        if cached and cached[0] > time.time():
+            return cached[1]
 
     try:
         mongodb_uri = os.environ.get("MONGODB_URI")
@@ -83,13 +337,24 @@ def get_recent_notices(collection_name: str) -> List[Dict[str, Any]]:
         # ISO 형식 문자열로 변환
         thirty_days_ago_iso = thirty_days_ago.isoformat()
 
+        # published는 BSON date로 저장되지만, 과거 문서는 ISO 문자열일 수 있어
+        # 전환 기간 동안 두 타입 모두 조회함
         notices = list(
             collection.find(
-                {"published": {"$gte": thirty_days_ago_iso}},
-                {"title": 1, "link": 1, "_id": 0},
+                {
+                    "$or": [
+                        {"published": {"$gte": thirty_days_ago}},
+                        {"published": {"$gte": thirty_days_ago_iso}},
+                    ]
+                },
+                projection,
             )
         )
         client.close()
+        _recent_notices_cache[collection_name] = (
+            time.time() + CACHE_TTL_SECONDS,
+            notices,
+        )
         return notices
 
     except Exception as e:
@@ -101,10 +366,73 @@ def get_recent_notices(collection_name: str) -> List[Dict[str, Any]]:
         return []
 
 
+def find_existing_notices(
+    collection_name: str,
+    links: List[str],
+    titles: List[str],
+) -> List[Dict[str, Any]]:
+    """후보 링크/제목과 겹치는 기존 공지만 MongoDB에서 조회
+
+    최근 30일 창 전체를 내려받는 대신 이번에 파싱한 후보들만 $in으로
+    조회해, 전송량이 실제 중복 수에 비례하도록 합니다.
+    """
+
+    try:
+        mongodb_uri = os.environ.get("MONGODB_URI")
+        mongodb_database = os.environ.get("DB_NAME")
+
+        if not mongodb_uri or not mongodb_database:
+            print("❌ [DB] MongoDB 연결 정보가 없습니다")
+            return []
+
+        client = MongoClient(mongodb_uri)
+        db = client[mongodb_database]
+        collection = db[collection_name]
+
+        existing = list(
+            collection.find(
+                {
+                    "$or": [
+                        {"link": {"$in": links}},
+                        {"title": {"$in": titles}},
+                    ]
+                },
+                DEDUP_PROJECTION,
+            )
+        )
+        client.close()
+        return existing
+
+    except Exception as e:
+        error_msg = f"기존 공지사항 조회 중 오류: {e}"
+        print(f"❌ [DB] {error_msg}")
+        send_common_utils_error_notification(
+            "find_existing_notices",
+            error_msg,
+            f"컬렉션: {collection_name}, 후보 개수: {len(links)}",
+        )
+        return []
+
+
+# link 유니크 인덱스를 이미 만든 컬렉션 (워밍된 컨테이너에서 재생성 방지)
+_link_index_ensured: set = set()
+
+
 def save_notices_to_db(notices: List[Dict[str, Any]], collection_name: str) -> int:
-    """새로운 공지사항들을 MongoDB에 저장"""
+    """새로운 공지사항들을 MongoDB에 저장
+
+    published는 BSON date로 저장합니다. 아직 ISO 문자열을 넘기는 핸들러가
+    있으면 여기서 datetime으로 변환해 타입을 통일합니다.
+    """
 
     try:
+        for notice in notices:
+            published = notice.get("published")
+            if isinstance(published, str):
+                notice["published"] = datetime.fromisoformat(
+                    published.replace("Z", "+00:00")
+                )
+
         mongodb_uri = os.environ.get("MONGODB_URI")
         mongodb_database = os.environ.get("DB_NAME")
 
@@ -116,14 +444,36 @@ def save_notices_to_db(notices: List[Dict[str, Any]], collection_name: str) -> i
         db = client[mongodb_database]
         collection = db[collection_name]
 
-        # 배치 인서트
+        # 인덱스 보장 (컨테이너 수명 동안 컬렉션당 1회)
+        # link 유니크 인덱스는 중복 차단, published 인덱스는 최근 공지 조회용
+        if collection_name not in _link_index_ensured:
+            collection.create_index("link", unique=True)
+            collection.create_index([("published", -1)])
+            _link_index_ensured.add(collection_name)
+
+        # 링크 기준 멱등 업서트 - 중복 링크는 그대로 건너뛰고 새 문서만 삽입
         if notices:
-            result = collection.insert_many(notices)
-            inserted_count = len(result.inserted_ids)
+            result = collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"link": notice["link"]},
+                        {"$setOnInsert": notice},
+                        upsert=True,
+                    )
+                    for notice in notices
+                ],
+                ordered=False,
+            )
+            inserted_count = result.upserted_count
         else:
             inserted_count = 0
 
         client.close()
+
+        # 저장 이후의 중복 확인이 어긋나지 않도록 조회 캐시를 무효화
+        if inserted_count:
+            _recent_notices_cache.pop(collection_name, None)
+
         return inserted_count
 
     except Exception as e:
@@ -137,6 +487,161 @@ def save_notices_to_db(notices: List[Dict[str, Any]], collection_name: str) -> i
         return 0
 
 
+# b-title-box 형태 게시판 행 파싱에 쓰이는 정규식 (모듈 로드 시 1회 컴파일)
+_WHITESPACE_RE = re.compile(r"\s+")
+_DETAIL_SUFFIX_RE = re.compile(r" 자세히 보기$")
+_SHORT_DATE_RE = re.compile(r"(\d{2})\.(\d{2})\.(\d{2})")
+
+
+@lru_cache(maxsize=1024)
+def parse_kst_date(date_str: str, kst) -> datetime:
+    """게시판 날짜 문자열을 KST datetime으로 변환 (문자열 단위 캐시)
+
+    같은 날짜 문자열이 페이지 안에서(그리고 매 크롤링마다) 반복되므로
+    lru_cache로 파싱 결과를 재사용합니다. datetime은 불변 객체라
+    호출자 간 공유가 안전합니다.
+
+    학과 게시판 날짜는 YYYY-MM-DD / YYYY.MM.DD / YY.MM.DD 셋 중 하나로
+    고정이므로, strptime을 형식별로 시도하는 대신 길이와 구분자 위치로
+    한 번에 판별해 슬라이스로 생성합니다. 그 밖의 형식은 strptime과
+    동일하게 ValueError를 냅니다.
+    """
+
+    if len(date_str) == 10 and date_str[4] in "-." and date_str[7] == date_str[4]:
+        # YYYY-MM-DD / YYYY.MM.DD
+        return datetime(
+            int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]), tzinfo=kst
+        )
+    if len(date_str) == 8 and date_str[2] == "." and date_str[5] == ".":
+        # YY.MM.DD (2000년대로 가정)
+        return datetime(
+            2000 + int(date_str[:2]), int(date_str[3:5]), int(date_str[6:8]), tzinfo=kst
+        )
+    raise ValueError(f"지원하지 않는 날짜 형식: {date_str}")
+
+
+class BoardSpec(NamedTuple):
+    """b-num-box/b-title-box/b-date 구조 게시판의 사이트별 파싱 설정"""
+
+    scraper_type: str
+    base_url: str
+    clean_title: bool = False  # 공백 정리 및 "자세히 보기" 제거 여부
+
+
+def parse_board_notice(element, spec: BoardSpec, kst) -> Dict[str, Any]:
+    """b-title-box 형태 게시판 행에서 공지사항 정보를 추출
+
+    미디어전공/정치외교학과/사회학과처럼 같은 CMS 템플릿을 쓰는 게시판은
+    셀렉터와 날짜 형식이 동일하므로 BoardSpec으로 사이트별 차이만 설정합니다.
+    """
+
+    try:
+        # 상단 고정 공지 여부 확인
+        notice_box = element.find(class_="b-num-box")
+        is_top_notice = notice_box and "num-notice" in notice_box.get("class", [])
+
+        # 제목과 링크 추출
+        title_box = element.find(class_="b-title-box")
+        title_element = title_box.a if title_box else None
+        if not title_element:
+            return None
+
+        if spec.clean_title:
+            # 제목 텍스트 정리 - 연속 공백 치환 및 "자세히 보기" 제거
+            # 대부분의 제목은 정리할 게 없으므로 정규식 실행 전에 싸게 검사
+            title = title_element.get_text(strip=True)
+            if "\n" in title or "\t" in title or "  " in title:
+                title = _WHITESPACE_RE.sub(" ", title).strip()
+            if title.endswith(" 자세히 보기"):
+                title = title[: -len(" 자세히 보기")]
+            if title.endswith("..."):
+                # 잘린 제목이면 title 속성에서 완전한 제목을 가져오려고 시도
+                full_title = title_element.get("title", "")
+                if full_title and "자세히 보기" in full_title:
+                    title = _DETAIL_SUFFIX_RE.sub("", full_title)
+        else:
+            title = title_element.text.strip()
+
+        # 상단 고정 공지는 제목에 [공지] 표시 추가 (없는 경우에만)
+        if is_top_notice and not title.startswith("[공지]"):
+            title = f"[공지] {title}"
+
+        # 링크 처리 (상대 경로인 경우 기본 URL과 결합)
+        link_href = title_element.get("href", "")
+        if link_href.startswith("?"):
+            link = f"{spec.base_url.split('?')[0]}{link_href}"
+        else:
+            link = link_href
+
+        # 날짜 추출 (YY.MM.DD 형식)
+        published = None
+        date_element = element.find(class_="b-date")
+        if date_element:
+            date_match = _SHORT_DATE_RE.search(date_element.text.strip())
+            if date_match:
+                year, month, day = date_match.groups()
+                # 20년대로 가정
+                published = datetime(
+                    2000 + int(year), int(month), int(day), tzinfo=kst
+                )
+        if published is None:
+            published = datetime.now(kst)
+
+        return {
+            "title": title,
+            "link": link,
+            "published": published,
+            "scraper_type": spec.scraper_type,
+        }
+
+    except Exception as e:
+        print(f"❌ [PARSE] 공지사항 파싱 중 오류: {e}")
+        return None
+
+
+def migrate_published_to_datetime(collection_name: str) -> int:
+    """published가 ISO 문자열로 저장된 과거 문서를 BSON date로 일괄 변환
+
+    일회성 마이그레이션 용도로, 변환한 문서 수를 반환합니다.
+    """
+
+    try:
+        mongodb_uri = os.environ.get("MONGODB_URI")
+        mongodb_database = os.environ.get("DB_NAME")
+
+        if not mongodb_uri or not mongodb_database:
+            print("❌ [DB] MongoDB 연결 정보가 없습니다")
+            return 0
+
+        client = MongoClient(mongodb_uri)
+        db = client[mongodb_database]
+        collection = db[collection_name]
+
+        migrated = 0
+        for doc in collection.find(
+            {"published": {"$type": "string"}}, {"published": 1}
+        ):
+            published = datetime.fromisoformat(
+                doc["published"].replace("Z", "+00:00")
+            )
+            collection.update_one(
+                {"_id": doc["_id"]}, {"$set": {"published": published}}
+            )
+            migrated += 1
+
+        client.close()
+        print(f"✅ [DB] published 타입 변환 완료: {collection_name}, {migrated}개")
+        return migrated
+
+    except Exception as e:
+        error_msg = f"published 타입 변환 중 오류: {e}"
+        print(f"❌ [DB] {error_msg}")
+        send_common_utils_error_notification(
+            "migrate_published_to_datetime", error_msg, f"컬렉션: {collection_name}"
+        )
+        return 0
+
+
 def send_slack_notification(message: str, scraper_type: str = "unknown") -> bool:
     """Slack으로 에러 알림을 보냄"""
 
@@ -0,0 +1,70 @@
+import asyncio
+from typing import Dict, Any
+
+from common_utils import send_slack_notification
+from lambda_web_scraper.university_academic_handler import scrape_university_academic
+from lambda_web_scraper.university_contestevent_handler import (
+    scrape_university_contestevent,
+)
+from lambda_web_scraper.university_scholarship_handler import (
+    scrape_university_scholarship,
+)
+from lambda_web_scraper.university_speciallecture_handler import (
+    scrape_university_speciallecture,
+)
+
+# 한 컨테이너에서 함께 실행할 대학 공지 스크래퍼 목록
+SYNC_SCRAPERS = {
+    "university_academic": scrape_university_academic,
+    "university_scholarship": scrape_university_scholarship,
+    "university_speciallecture": scrape_university_speciallecture,
+}
+
+
+def handler(event, context):
+    """
+    대학 공지 스크래퍼 통합 Lambda Handler
+
+    사이트별 Lambda의 콜드스타트/DB 연결 비용을 컨테이너 하나로
+    모으고, 네 개 스크래핑을 동시에 실행해 전체 시간을
+    가장 느린 사이트 수준으로 줄입니다.
+    """
+
+    print(f"🚀 [ORCHESTRATOR] 대학 통합 스크래퍼 시작 - 대상 {len(SYNC_SCRAPERS) + 1}개")
+
+    try:
+        results = asyncio.run(run_all_scrapers())
+
+        success_count = sum(1 for r in results.values() if r.get("success"))
+        print(
+            f"🎉 [ORCHESTRATOR] 완료 - 성공: {success_count}/{len(results)}"
+        )
+
+        return {
+            "statusCode": 200,
+        }
+
+    except Exception as e:
+        error_msg = f"대학 통합 스크래퍼 실행 중 오류: {str(e)}"
+        print(f"❌ [ORCHESTRATOR] {error_msg}")
+        send_slack_notification(error_msg, "all_university")
+        return {
+            "statusCode": 500,
+        }
+
+
+async def run_all_scrapers() -> Dict[str, Dict[str, Any]]:
+    """대학 공지 스크래퍼 네 개를 동시에 실행하고 결과를 모음
+
+    동기 구현인 스크래퍼는 asyncio.to_thread로 감싸고, 이미 비동기인
+    contestevent 스크래퍼는 코루틴 그대로 gather에 넣습니다. 실패한
+    사이트는 각 함수 내부의 예외 처리로 {"success": False} 결과가 되어
+    전체 실행을 막지 않습니다.
+    """
+
+    names = list(SYNC_SCRAPERS) + ["university_contestevent"]
+    results = await asyncio.gather(
+        *[asyncio.to_thread(SYNC_SCRAPERS[name]) for name in SYNC_SCRAPERS],
+        scrape_university_contestevent(),
+    )
+    return dict(zip(names, results))
@@ -1,15 +1,19 @@
 import feedparser
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
 import pytz
 from typing import Dict, Any
 
 from common_utils import (
-    fetch_page,
+    fetch_rss,
     get_recent_notices,
     save_notices_to_db,
     send_slack_notification,
 )
 
+# 이전 응답의 ETag/Last-Modified (워밍된 컨테이너에서 조건부 요청에 사용)
+_FEED_CACHE = {"etag": None, "last_modified": None}
+
 
 def handler(event, context):
     """
@@ -38,9 +42,15 @@ def handler(event, context):
 
 
 def parse_date(date_str):
-    """RSS 날짜 문자열을 datetime 객체로 변환합니다."""
+    """RSS 날짜 문자열을 datetime 객체로 변환합니다.
+
+    RFC-822 날짜는 stdlib의 전용 파서가 strptime보다 빠르고
+    (%a/%b 로케일 조회 없이) 로케일에도 무관합니다.
+    """
     try:
-        dt = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %z")
+        dt = parsedate_to_datetime(date_str)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=pytz.timezone("Asia/Seoul"))
         return dt
     except Exception as e:
         print(f"❌ [PARSE] 날짜 파싱 오류: {e}")
@@ -63,38 +73,55 @@ def scrape_creativeengineering_electrical_academic_rss() -> Dict[str, Any]:
         recent_links = {notice.get("link") for notice in recent_notices}
         recent_titles = {notice.get("title") for notice in recent_notices}
 
-        # RSS 피드 파싱
-        feed = feedparser.parse(url)
+        # RSS 피드 본문 가져오기 (공용 세션 + 조건부 요청) 후 파싱
+        body, etag, last_modified = fetch_rss(
+            url,
+            etag=_FEED_CACHE["etag"],
+            last_modified=_FEED_CACHE["last_modified"],
+        )
+        if body is None:
+            print("🔁 [SCRAPER] RSS 피드 변경 없음 (304) - 파싱 건너뜀")
+            return {
+                "success": True,
+                "message": "RSS 피드 변경 없음",
+                "total_found": 0,
+                "new_notices_count": 0,
+                "saved_count": 0,
+                "new_notices": [],
+            }
+        _FEED_CACHE["etag"] = etag
+        _FEED_CACHE["last_modified"] = last_modified
+        feed = feedparser.parse(body)
         new_notices = []
 
         print(f"📊 [SCRAPER] RSS 피드 항목 수: {len(feed.entries)}")
 
+        # 30일 이내의 데이터만 필터링 (기준 시각은 루프 동안 변하지 않음)
+        thirty_days_ago = datetime.now(kst) - timedelta(days=30)
+
         for entry in feed.entries[:20]:  # 최근 20개만 가져오기
-            notice = {
-                "title": entry.title,
-                "link": entry.link,
-                "published": parse_date(entry.published).isoformat(),
-                "scraper_type": "creativeengineering_electrical_academic_rss",
-            }
+            title = entry.title
+            link = entry.link
 
-            print(f"📝 [SCRAPER] 공지사항: {notice['title'][:30]}...")
+            # 중복이면 날짜 파싱과 dict 생성 전에 건너뜀
+            if link in recent_links or title in recent_titles:
+                print(f"⏭️ [SCRAPER] 중복 공지사항 건너뜀: {title[:30]}...")
+                continue
 
-            # 30일 이내의 데이터만 필터링
-            thirty_days_ago = datetime.now(kst) - timedelta(days=30)
             published_date = parse_date(entry.published)
-            if published_date >= thirty_days_ago:
-                # 중복 확인
-                if notice["link"] in recent_links or notice["title"] in recent_titles:
-                    print(
-                        f"⏭️ [SCRAPER] 중복 공지사항 건너뜀: {notice['title'][:30]}..."
-                    )
-                else:
-                    new_notices.append(notice)
-                    print(f"🆕 [SCRAPER] 새로운 공지사항: {notice['title'][:30]}...")
-            else:
-                print(
-                    f"⏰ [SCRAPER] 30일 이전 공지사항 제외: {notice['title'][:30]}..."
-                )
+            if published_date < thirty_days_ago:
+                print(f"⏰ [SCRAPER] 30일 이전 공지사항 제외: {title[:30]}...")
+                continue
+
+            new_notices.append(
+                {
+                    "title": title,
+                    "link": link,
+                    "published": published_date.isoformat(),
+                    "scraper_type": "creativeengineering_electrical_academic_rss",
+                }
+            )
+            print(f"🆕 [SCRAPER] 새로운 공지사항: {title[:30]}...")
 
         print(f"📈 [SCRAPER] 새로운 공지사항 수: {len(new_notices)}")
 
@@ -1,14 +1,27 @@
 from datetime import datetime, timedelta
 import pytz
+import soupsieve
 from typing import Dict, Any
 
 from common_utils import (
     fetch_page,
     get_recent_notices,
+    parse_kst_date,
     save_notices_to_db,
     send_slack_notification,
 )
 
+# CSS 셀렉터는 모듈 로드 시 1회만 컴파일
+_ROW_SEL = soupsieve.compile("#kboard-default-list .kboard-list tbody tr")
+_TITLE_SEL = soupsieve.compile(".kboard-list-title div.cut_strings a")
+_DATE_SEL = soupsieve.compile(".kboard-list-date")
+
+# 타임존 객체는 모듈 로드 시 1회만 생성
+KST = pytz.timezone("Asia/Seoul")
+
+# 상대 링크 앞에 붙일 고정 접두사 (f-string 대신 단순 연결로 사용)
+_LINK_PREFIX = "http://mcraft.kookmin.ac.kr"
+
 
 def handler(event, context):
     """
@@ -36,13 +49,12 @@ def scrape_design_metalwork_academic() -> None:
     금속공예학과 학사공지를 스크래핑하고 새로운 공지사항을 처리
     """
     url = "http://mcraft.kookmin.ac.kr/?page_id=516"
-    kst = pytz.timezone("Asia/Seoul")
     print(f"🌐 [SCRAPER] 스크래핑 시작 - URL: {url}")
     try:
         # 웹페이지 가져오기
         soup = fetch_page(url)
         # 공지사항 목록 요소들 가져오기
-        elements = soup.select("#kboard-default-list .kboard-list tbody tr")
+        elements = _ROW_SEL.select(soup)
         print(f"📊 [SCRAPER] 발견된 공지사항 수: {len(elements)}")
         # 기존 공지사항 확인 (MongoDB에서)
         recent_notices = get_recent_notices("design_metalwork_academic")
@@ -51,10 +63,10 @@ def scrape_design_metalwork_academic() -> None:
         # 새로운 공지사항 파싱
         new_notices = []
         for element in elements:
-            notice = parse_notice_from_element(element, kst, url)
+            notice = parse_notice_from_element(element, KST, url)
             if notice:
                 # 30일 이내의 데이터만 필터링
-                thirty_days_ago = datetime.now(kst) - timedelta(days=30)
+                thirty_days_ago = datetime.now(KST) - timedelta(days=30)
                 published_date = datetime.fromisoformat(
                     notice["published"].replace("Z", "+00:00")
                 )
@@ -86,45 +98,40 @@ def scrape_design_metalwork_academic() -> None:
 
 
 def parse_notice_from_element(element, kst, base_url) -> Dict[str, Any]:
-    """HTML 요소에서 금속공예학과 학사공지 정보를 추출"""
-    try:
-        # 공지사항 여부 확인
-        is_notice = "kboard-list-notice" in element.get("class", [])
-        # 제목과 링크 추출
-        title_element = element.select_one(".kboard-list-title div.cut_strings a")
-        if not title_element:
-            return None
-        title = title_element.get_text(strip=True)
-        relative_link = title_element.get("href", "")
-        # 상대 경로를 절대 경로로 변환
-        if relative_link.startswith("/?"):
-            link = f"http://mcraft.kookmin.ac.kr{relative_link}"
-        else:
-            link = relative_link
-        # 날짜 추출
-        date_td = element.select_one(".kboard-list-date")
-        if not date_td:
-            published = datetime.now(kst)
-        else:
-            date_str = date_td.get_text(strip=True)
-            try:
-                published = datetime.strptime(date_str, "%Y.%m.%d").replace(tzinfo=kst)
-            except ValueError:
-                try:
-                    published = datetime.strptime(date_str, "%Y-%m-%d").replace(
-                        tzinfo=kst
-                    )
-                except ValueError:
-                    published = datetime.strptime(date_str, "%y.%m.%d").replace(
-                        tzinfo=kst
-                    )
-        result = {
-            "title": title,
-            "link": link,
-            "published": published.isoformat(),
-            "scraper_type": "design_metalwork_academic",
-        }
-        return result
-    except Exception as e:
-        print(f"❌ [PARSE] 공지사항 파싱 중 오류: {e}")
+    """HTML 요소에서 금속공예학과 학사공지 정보를 추출
+
+    정상 경로는 예외 없이 통과하도록 None 검사로 처리하고,
+    실제로 실패할 수 있는 날짜 변환에만 좁은 try를 둡니다.
+    """
+    # 공지사항 여부 확인
+    is_notice = "kboard-list-notice" in element.get("class", [])
+    # 제목과 링크 추출
+    title_element = _TITLE_SEL.select_one(element)
+    if not title_element:
         return None
+    title = title_element.get_text(strip=True)
+    relative_link = title_element.get("href", "")
+    # 상대 경로를 절대 경로로 변환 (두 글자 판별이므로 인덱스 비교)
+    if len(relative_link) > 1 and relative_link[0] == "/" and relative_link[1] == "?":
+        link = _LINK_PREFIX + relative_link
+    else:
+        link = relative_link
+    # 날짜 추출
+    date_td = _DATE_SEL.select_one(element)
+    if not date_td:
+        published = datetime.now(KST)
+    else:
+        date_str = date_td.get_text(strip=True)
+        try:
+            # 형식별 strptime 시도 대신 구분자/길이로 한 번에 판별
+            published = parse_kst_date(date_str, kst)
+        except ValueError as e:
+            print(f"❌ [PARSE] 날짜 파싱 중 오류: {e}")
+            return None
+    result = {
+        "title": title,
+        "link": link,
+        "published": published.isoformat(),
+        "scraper_type": "design_metalwork_academic",
+    }
+    return result
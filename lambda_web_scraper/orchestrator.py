@@ -0,0 +1,74 @@
+import asyncio
+from typing import Dict, Any
+
+from common_utils import send_slack_notification
+from lambda_web_scraper.socialscience_communication_media_academic_handler import (
+    scrape_socialscience_communication_media_academic,
+)
+from lambda_web_scraper.socialscience_politicalscience_academic_handler import (
+    scrape_socialscience_politicalscience_academic,
+)
+from lambda_web_scraper.socialscience_publicadministration_academic_handler import (
+    scrape_socialscience_publicadministration_academic,
+)
+from lambda_web_scraper.socialscience_sociology_academic_handler import (
+    scrape_socialscience_sociology_academic,
+)
+from lambda_web_scraper.softwarecentered_academic_handler import (
+    scrape_softwarecentered_academic,
+)
+
+# 한 컨테이너에서 함께 실행할 스크래퍼 목록
+SCRAPERS = {
+    "socialscience_communication_media_academic": scrape_socialscience_communication_media_academic,
+    "socialscience_politicalscience_academic": scrape_socialscience_politicalscience_academic,
+    "socialscience_publicadministration_academic": scrape_socialscience_publicadministration_academic,
+    "socialscience_sociology_academic": scrape_socialscience_sociology_academic,
+    "softwarecentered_academic": scrape_softwarecentered_academic,
+}
+
+
+def handler(event, context):
+    """
+    사회과학대/소프트웨어 계열 스크래퍼 통합 Lambda Handler
+
+    사이트별 Lambda를 따로 콜드스타트하는 대신 한 컨테이너에서
+    asyncio.gather로 동시에 실행해 초기화 비용과 연결 풀을 공유합니다.
+    """
+
+    print(f"🚀 [ORCHESTRATOR] 통합 스크래퍼 시작 - 대상 {len(SCRAPERS)}개")
+
+    try:
+        results = asyncio.run(run_all_scrapers())
+
+        success_count = sum(1 for r in results.values() if r.get("success"))
+        print(
+            f"🎉 [ORCHESTRATOR] 완료 - 성공: {success_count}/{len(SCRAPERS)}"
+        )
+
+        return {
+            "statusCode": 200,
+        }
+
+    except Exception as e:
+        error_msg = f"통합 스크래퍼 실행 중 오류: {str(e)}"
+        print(f"❌ [ORCHESTRATOR] {error_msg}")
+        send_slack_notification(error_msg, "orchestrator")
+        return {
+            "statusCode": 500,
+        }
+
+
+async def run_all_scrapers() -> Dict[str, Dict[str, Any]]:
+    """모든 스크래퍼를 스레드로 내려 동시에 실행하고 결과를 모음
+
+    개별 scrape_* 함수는 동기(blocking) 구현이므로 asyncio.to_thread로
+    감싸 네트워크 대기를 겹치게 합니다. 실패한 사이트는 각 함수 내부의
+    예외 처리로 {"success": False} 결과가 되어 전체 실행을 막지 않습니다.
+    """
+
+    names = list(SCRAPERS)
+    results = await asyncio.gather(
+        *[asyncio.to_thread(SCRAPERS[name]) for name in names]
+    )
+    return dict(zip(names, results))
@@ -4,7 +4,7 @@ import pytz
 from typing import Dict, Any
 
 from common_utils import (
-    fetch_page,
+    fetch_page_conditional,
     get_recent_notices,
     save_notices_to_db,
     send_slack_notification,
@@ -47,8 +47,18 @@ def scrape_sciencetechnology_security_academic() -> Dict[str, Any]:
     print(f"🌐 [SCRAPER] 스크래핑 시작 - URL: {url}")
 
     try:
-        # 웹페이지 가져오기
-        soup = fetch_page(url)
+        # 웹페이지 가져오기 (ETag/Last-Modified 기반 조건부 요청)
+        soup = fetch_page_conditional(url, "sciencetechnology_security_academic")
+        if soup is None:
+            print("⏭️ [SCRAPER] 페이지 변경 없음 - 스크래핑 건너뜀")
+            return {
+                "success": True,
+                "message": f"정보보안암호수학과 학사공지 변경 없음 (304)",
+                "total_found": 0,
+                "new_notices_count": 0,
+                "saved_count": 0,
+                "new_notices": [],
+            }
 
         # 공지사항 목록 요소들 가져오기
         elements = soup.select("tbody tr")
@@ -119,14 +129,9 @@ def parse_notice_from_element(element, kst, base_url) -> Dict[str, Any]:
 
     try:
         # 공지사항 여부 확인
-        is_notice = False
         num_box = element.select_one(".b-num-box")
-        if (
-            num_box
-            and num_box.select_one("span")
-            and "공지" in num_box.select_one("span").text
-        ):
-            is_notice = True
+        num_span = num_box.select_one("span") if num_box else None
+        is_notice = bool(num_span and "공지" in num_span.text)
 
         # 제목과 링크 추출
         title_element = element.select_one(".b-title-box a")
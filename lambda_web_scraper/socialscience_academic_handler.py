@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 import pytz
 from typing import Dict, Any
 from common_utils import (
-    fetch_page,
+    fetch_page_conditional,
     get_recent_notices,
     save_notices_to_db,
     send_slack_notification,
@@ -45,8 +45,18 @@ def scrape_socialscience_academic() -> Dict[str, Any]:
     print(f"🌐 [SCRAPER] 스크래핑 시작 - URL: {url}")
 
     try:
-        # 웹페이지 가져오기
-        soup = fetch_page(url)
+        # 웹페이지 가져오기 (ETag/Last-Modified 기반 조건부 요청)
+        soup = fetch_page_conditional(url, "socialscience_academic")
+        if soup is None:
+            print("⏭️ [SCRAPER] 페이지 변경 없음 - 스크래핑 건너뜀")
+            return {
+                "success": True,
+                "message": f"사회과학대학 학사공지 변경 없음 (304)",
+                "total_found": 0,
+                "new_notices_count": 0,
+                "saved_count": 0,
+                "new_notices": [],
+            }
 
         # 공지사항 목록 요소들 가져오기
         table = soup.select_one("table.board-table")
@@ -155,8 +165,11 @@ def parse_notice_from_element(element, kst, base_url) -> Dict[str, Any]:
             link = f"https://social.kookmin.ac.kr/{relative_link}"
 
         # 날짜 추출 - b-date 클래스 내의 텍스트 사용
+        date_str = None
         date_span = element.select_one("span.b-date")
-        if not date_span:
+        if date_span:
+            date_str = date_span.text.strip()
+        else:
             # 테이블의 날짜 셀에서 시도
             date_td = element.select_one("td:nth-child(4)")  # 4번째 셀이 날짜인 경우
             if date_td and date_td.text.strip():
@@ -164,10 +177,8 @@ def parse_notice_from_element(element, kst, base_url) -> Dict[str, Any]:
             else:
                 print("⚠️ [PARSE] 날짜 요소를 찾을 수 없음")
                 published = datetime.now(kst)
-        else:
-            date_str = date_span.text.strip()
 
-        if "date_str" in locals():
+        if date_str is not None:
             try:
                 # YYYY-MM-DD 형식 (예: 2022-03-11)
                 published = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=kst)
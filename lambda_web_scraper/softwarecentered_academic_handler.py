@@ -1,13 +1,20 @@
+import logging
 from datetime import datetime, timedelta
 import pytz
+from bs4 import SoupStrainer
 from typing import Dict, Any
 from common_utils import (
     fetch_page,
-    get_recent_notices,
     save_notices_to_db,
     send_slack_notification,
 )
 
+# 행 단위 로그는 DEBUG로 낮춰 CloudWatch 출력 비용을 줄임
+logger = logging.getLogger(__name__)
+
+# 타임존 객체는 모듈 로드 시 1회만 생성
+KST = pytz.timezone("Asia/Seoul")
+
 
 def handler(event, context):
     """
@@ -40,48 +47,49 @@ def scrape_softwarecentered_academic() -> Dict[str, Any]:
     """
 
     url = "https://software.kookmin.ac.kr/software/bulletin/notice.do"
-    kst = pytz.timezone("Asia/Seoul")
 
     print(f"🌐 [SCRAPER] 스크래핑 시작 - URL: {url}")
 
     try:
-        # 웹페이지 가져오기
-        soup = fetch_page(url)
+        # 웹페이지 가져오기 (필요한 tbody 부분 트리만 파싱)
+        soup = fetch_page(url, strainer=SoupStrainer("tbody"))
 
         # 공지사항 목록 요소들 가져오기
-        elements = soup.select("table tbody tr")
+        # strainer로 잘라낸 트리는 tbody가 최상위이므로 table 조상은 셀렉터에 못 씀
+        elements = soup.select("tbody tr")
         print(f"📊 [SCRAPER] 발견된 공지사항 수: {len(elements)}")
 
-        # 기존 공지사항 확인 (MongoDB에서)
-        recent_notices = get_recent_notices("softwarecentered_academic")
-        recent_links = {notice.get("link") for notice in recent_notices}
-        recent_titles = {notice.get("title") for notice in recent_notices}
-
         # 새로운 공지사항 파싱
+        # 30일 이내의 데이터만 필터링 (기준 시각은 루프 동안 변하지 않음)
+        thirty_days_ago = datetime.now(KST) - timedelta(days=30)
         new_notices = []
+        # 같은 페이지에 두 번 노출되는 고정 공지를 걸러내기 위한 링크 집합
+        seen_links = set()
 
         for element in elements:
-            notice = parse_notice_from_element(element, url, kst)
+            notice = parse_notice_from_element(element, url, KST)
             if notice:
-                # 30일 이내의 데이터만 필터링
-                thirty_days_ago = datetime.now(kst) - timedelta(days=30)
-                published_date = datetime.fromisoformat(
-                    notice["published"].replace("Z", "+00:00")
-                )
+                if notice["link"] in seen_links:
+                    continue
+                seen_links.add(notice["link"])
+
+                # published는 datetime 그대로 저장됨 (BSON date)
+                published_date = notice["published"]
                 if published_date >= thirty_days_ago:
-                    # 중복 확인
-                    if (
-                        notice["link"] not in recent_links
-                        and notice["title"] not in recent_titles
-                    ):
-                        new_notices.append(notice)
-                        print(
-                            f"🆕 [SCRAPER] 새로운 공지사항: {notice['title'][:30]}..."
-                        )
+                    # 중복 여부는 link 유니크 인덱스 업서트가 DB에서 걸러냄
+                    new_notices.append(notice)
+                    logger.debug(
+                        "🆕 [SCRAPER] 새로운 공지사항: %s...", notice["title"][:30]
+                    )
                 else:
-                    print(
-                        f"⏰ [SCRAPER] 30일 이전 공지사항 제외: {notice['title'][:30]}..."
+                    logger.debug(
+                        "⏰ [SCRAPER] 30일 이전 공지사항 제외: %s...", notice["title"][:30]
                     )
+                    # 고정 공지 이후의 일반 공지는 날짜 내림차순이므로,
+                    # 30일보다 오래된 일반 공지를 만나면 그 뒤는 전부 더 오래된 글이다
+                    if not notice["title"].startswith("[공지]"):
+                        logger.debug("⏹️ [SCRAPER] 이후 행은 모두 30일 이전 - 조기 종료")
+                        break
 
         print(f"📈 [SCRAPER] 새로운 공지사항 수: {len(new_notices)}")
 
@@ -114,15 +122,24 @@ def parse_notice_from_element(row, url, kst) -> Dict[str, Any]:
     """HTML 요소에서 SW중심대학 공지사항 정보를 추출"""
 
     try:
-        title_cell = row.select_one(".b-td-left")
+        # 상단 고정 공지 여부 확인 (조기 종료 판단이 제목의 [공지] 표시에 의존)
+        notice_box = row.find(class_="b-num-box")
+        is_top_notice = notice_box and "num-notice" in notice_box.get("class", [])
+
+        title_cell = row.find(class_="b-td-left")
         if not title_cell:
             return None
 
-        title_elem = title_cell.select_one(".b-title-box a")
+        title_box = title_cell.find(class_="b-title-box")
+        title_elem = title_box.a if title_box else None
         if not title_elem:
             return None
 
         title = title_elem.text.strip()
+
+        # 상단 고정 공지는 제목에 [공지] 표시 추가 (없는 경우에만)
+        if is_top_notice and not title.startswith("[공지]"):
+            title = f"[공지] {title}"
         href = title_elem.get("href", "")
         article_no = (
             href.split("articleNo=")[1].split("&")[0] if "articleNo=" in href else ""
@@ -139,7 +156,7 @@ def parse_notice_from_element(row, url, kst) -> Dict[str, Any]:
         result = {
             "title": title,
             "link": link,
-            "published": published.isoformat(),
+            "published": published,
             "scraper_type": "softwarecentered_academic",
         }
 
@@ -1,13 +1,24 @@
+import logging
 from datetime import datetime, timedelta
 import pytz
 from typing import Dict, Any
 from common_utils import (
     fetch_page,
     get_recent_notices,
+    parse_kst_date,
     save_notices_to_db,
     send_slack_notification,
 )
 
+# 행 단위 로그는 DEBUG로 낮춰 CloudWatch 출력 비용을 줄임
+logger = logging.getLogger(__name__)
+
+# 타임존 객체는 모듈 로드 시 1회만 생성
+KST = pytz.timezone("Asia/Seoul")
+
+# 상대 링크 앞에 붙일 고정 접두사 (f-string 대신 단순 연결로 사용)
+_LINK_PREFIX = "https://cs.kookmin.ac.kr/news/kookmin/academic/"
+
 
 def handler(event, context):
     """
@@ -40,7 +51,6 @@ def scrape_university_academic() -> Dict[str, Any]:
     """
 
     url = "https://cs.kookmin.ac.kr/news/kookmin/academic/"
-    kst = pytz.timezone("Asia/Seoul")
 
     print(f"🌐 [SCRAPER] 스크래핑 시작 - URL: {url}")
 
@@ -54,36 +64,41 @@ def scrape_university_academic() -> Dict[str, Any]:
 
         # 기존 공지사항 확인 (MongoDB에서)
         recent_notices = get_recent_notices("university_academic")
-        recent_links = {notice.get("link") for notice in recent_notices}
-        recent_titles = {notice.get("title") for notice in recent_notices}
+        # 링크/제목을 한 집합에 넣어 중복 확인을 해시 조회 1회로 줄임
+        recent_keys = {notice.get("link") for notice in recent_notices}
+        recent_keys.update(notice.get("title") for notice in recent_notices)
 
         # 새로운 공지사항 파싱
+        # 30일 이내의 데이터만 필터링 (기준 시각은 루프 동안 변하지 않음)
+        thirty_days_ago = datetime.now(KST) - timedelta(days=30)
         new_notices = []
+        duplicate_count = 0
+        too_old_count = 0
 
         for element in elements:
-            notice = parse_notice_from_element(element, kst)
+            notice = parse_notice_from_element(element, KST)
             if notice:
-                # 30일 이내의 데이터만 필터링
-                thirty_days_ago = datetime.now(kst) - timedelta(days=30)
-                published_date = datetime.fromisoformat(
-                    notice["published"].replace("Z", "+00:00")
-                )
+                # published는 datetime 그대로 저장됨 (BSON date)
+                published_date = notice["published"]
                 if published_date >= thirty_days_ago:
                     # 중복 확인
                     if (
-                        notice["link"] not in recent_links
-                        and notice["title"] not in recent_titles
+                        notice["link"] not in recent_keys
+                        and notice["title"] not in recent_keys
                     ):
                         new_notices.append(notice)
-                        print(
-                            f"🆕 [SCRAPER] 새로운 공지사항: {notice['title'][:30]}..."
+                        logger.debug(
+                            "🆕 [SCRAPER] 새로운 공지사항: %s...", notice["title"][:30]
                         )
+                    else:
+                        duplicate_count += 1
                 else:
-                    print(
-                        f"⏰ [SCRAPER] 30일 이전 공지사항 제외: {notice['title'][:30]}..."
-                    )
+                    too_old_count += 1
 
-        print(f"📈 [SCRAPER] 새로운 공지사항 수: {len(new_notices)}")
+        print(
+            f"📈 [SCRAPER] 새로운 공지사항 수: {len(new_notices)} "
+            f"(중복: {duplicate_count}개, 30일 이전: {too_old_count}개)"
+        )
 
         # 새로운 공지사항을 MongoDB에 저장
         saved_count = 0
@@ -111,37 +126,49 @@ def scrape_university_academic() -> Dict[str, Any]:
 
 
 def parse_notice_from_element(row, kst) -> Dict[str, Any]:
-    """HTML 요소에서 학사공지 정보를 추출"""
+    """HTML 요소에서 학사공지 정보를 추출
 
-    try:
-        title_tag = row.select_one(".subject a")
-        if not title_tag:
-            return None
+    정상 경로는 예외 없이 통과하도록 None 검사로 처리하고,
+    실제로 실패할 수 있는 날짜 변환에만 좁은 try를 둡니다.
+    """
 
-        title = title_tag.text.strip()
-        link = title_tag["href"]
+    # 행의 직계 셀을 한 번만 순회하며 제목/날짜 셀을 함께 찾음
+    title_tag = None
+    date_element = None
+    for cell in row.find_all(True, recursive=False):
+        cell_classes = cell.get("class", [])
+        if "subject" in cell_classes:
+            title_tag = cell.find("a")
+        elif "date" in cell_classes:
+            date_element = cell
+
+    if not title_tag:
+        return None
 
-        # 상대 링크를 절대 링크로 변환
-        if not link.startswith("http"):
-            link = f"https://cs.kookmin.ac.kr/news/kookmin/academic/{link}"
+    title = title_tag.text.strip()
+    link = title_tag.get("href")
+    if not link:
+        return None
 
-        # 날짜 추출
-        date_element = row.select_one(".date")
-        if not date_element:
-            return None
+    # 상대 링크를 절대 링크로 변환
+    if not link.startswith("http"):
+        link = _LINK_PREFIX + link
 
-        date_str = date_element.text.strip()
-        published = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=kst)
+    if not date_element:
+        return None
 
-        result = {
-            "title": title,
-            "link": link,
-            "published": published.isoformat(),
-            "scraper_type": "university_academic",
-        }
+    try:
+        # 고정 형식이므로 strptime 대신 공용 슬라이스 파서로 생성
+        published = parse_kst_date(date_element.text.strip(), kst)
+    except ValueError as e:
+        print(f"❌ [PARSE] 날짜 파싱 중 오류: {e}")
+        return None
 
-        return result
+    result = {
+        "title": title,
+        "link": link,
+        "published": published,
+        "scraper_type": "university_academic",
+    }
 
-    except Exception as e:
-        print(f"❌ [PARSE] 공지사항 파싱 중 오류: {e}")
-        return None
+    return result
@@ -1,15 +1,45 @@
+import asyncio
 import re
+import logging
 from datetime import datetime, timedelta
+
 import pytz
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from common_utils import (
     fetch_page,
+    fetch_page_async,
+    get_session,
     get_recent_notices,
     save_notices_to_db,
     send_slack_notification,
 )
 
+# 행 단위 로그는 DEBUG로 낮춰 CloudWatch 출력 비용을 줄임
+logger = logging.getLogger(__name__)
+
+# 타임존 객체는 모듈 로드 시 1회만 생성
+KST = pytz.timezone("Asia/Seoul")
+
+# 상세 페이지 날짜 파싱에 쓰이는 정규식 (모듈 로드 시 1회 컴파일)
+_WRITE_DATE_RE = re.compile(r"작성일\s+(\d{4}[-\.]\d{1,2}[-\.]\d{1,2})")
+_GEN_DATE_RE = re.compile(r"(\d{4}[-\.]\d{1,2}[-\.]\d{1,2})")
+
+# 상세 페이지 작성일 캐시 - 작성일은 변하지 않으므로 워밍된 컨테이너에서 재사용
+_detail_date_cache: Dict[str, datetime] = {}
+
+# 워밍된 컨테이너에서 재사용하는 이벤트 루프
+# 매 호출마다 asyncio.run으로 새 루프를 만들면 get_session()의 keep-alive
+# 연결이 함께 버려지므로, 루프를 닫지 않고 유지합니다.
+_event_loop = None
+
+
+def _get_event_loop():
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+    return _event_loop
+
 
 def handler(event, context):
     """
@@ -20,8 +50,10 @@ def handler(event, context):
     print("🚀 [HANDLER] Lambda Handler 시작")
 
     try:
-        # 동기 스크래퍼 실행
-        result = scrape_university_contestevent()
+        # 상세 페이지 동시 요청을 위해 비동기 스크래퍼 실행 (루프 재사용)
+        result = _get_event_loop().run_until_complete(
+            scrape_university_contestevent()
+        )
 
         return {
             "statusCode": 200,
@@ -36,13 +68,15 @@ def handler(event, context):
         }
 
 
-def scrape_university_contestevent() -> Dict[str, Any]:
+async def scrape_university_contestevent() -> Dict[str, Any]:
     """
     대학 공모행사공지를 스크래핑하고 새로운 공지사항을 처리
+
+    목록에서 날짜를 얻지 못한 공지(상단 고정 공지 등)의 상세 페이지는
+    aiohttp로 동시에 가져와 대기 시간을 요청 1회 수준으로 줄입니다.
     """
 
     url = "https://www.kookmin.ac.kr/user/kmuNews/notice/9/index.do"
-    kst = pytz.timezone("Asia/Seoul")
 
     print(f"🌐 [SCRAPER] 스크래핑 시작 - URL: {url}")
 
@@ -56,36 +90,55 @@ def scrape_university_contestevent() -> Dict[str, Any]:
 
         # 기존 공지사항 확인 (MongoDB에서)
         recent_notices = get_recent_notices("university_contestevent")
-        recent_links = {notice.get("link") for notice in recent_notices}
-        recent_titles = {notice.get("title") for notice in recent_notices}
+        # 링크/제목을 한 집합에 넣어 중복 확인을 해시 조회 1회로 줄임
+        recent_keys = {notice.get("link") for notice in recent_notices}
+        recent_keys.update(notice.get("title") for notice in recent_notices)
+
+        # 1차: 목록 페이지에서 파싱 (상세 페이지가 필요한 공지는 published=None)
+        parsed_notices = [parse_notice_from_element(element, KST) for element in elements]
+        parsed_notices = [notice for notice in parsed_notices if notice]
+
+        # 2차: 날짜가 없는 공지의 상세 페이지를 동시에 요청
+        detail_links = [n["link"] for n in parsed_notices if n["published"] is None]
+        if detail_links:
+            print(f"🔎 [SCRAPER] 상세 페이지 동시 요청: {len(detail_links)}개")
+            detail_dates = await fetch_detail_dates(detail_links, KST)
+            for notice in parsed_notices:
+                if notice["published"] is None:
+                    notice["published"] = detail_dates.get(
+                        notice["link"]
+                    ) or datetime.now(KST)
 
         # 새로운 공지사항 파싱
+        # 30일 이내의 데이터만 필터링 (기준 시각은 루프 동안 변하지 않음)
+        thirty_days_ago = datetime.now(KST) - timedelta(days=30)
         new_notices = []
+        duplicate_count = 0
+        too_old_count = 0
 
-        for element in elements:
-            notice = parse_notice_from_element(element, kst)
+        for notice in parsed_notices:
             if notice:
-                # 30일 이내의 데이터만 필터링
-                thirty_days_ago = datetime.now(kst) - timedelta(days=30)
-                published_date = datetime.fromisoformat(
-                    notice["published"].replace("Z", "+00:00")
-                )
+                # published는 datetime 그대로 저장됨 (BSON date)
+                published_date = notice["published"]
                 if published_date >= thirty_days_ago:
                     # 중복 확인
                     if (
-                        notice["link"] not in recent_links
-                        and notice["title"] not in recent_titles
+                        notice["link"] not in recent_keys
+                        and notice["title"] not in recent_keys
                     ):
                         new_notices.append(notice)
-                        print(
-                            f"🆕 [SCRAPER] 새로운 공지사항: {notice['title'][:30]}..."
+                        logger.debug(
+                            "🆕 [SCRAPER] 새로운 공지사항: %s...", notice["title"][:30]
                         )
+                    else:
+                        duplicate_count += 1
                 else:
-                    print(
-                        f"⏰ [SCRAPER] 30일 이전 공지사항 제외: {notice['title'][:30]}..."
-                    )
+                    too_old_count += 1
 
-        print(f"📈 [SCRAPER] 새로운 공지사항 수: {len(new_notices)}")
+        print(
+            f"📈 [SCRAPER] 새로운 공지사항 수: {len(new_notices)} "
+            f"(중복: {duplicate_count}개, 30일 이전: {too_old_count}개)"
+        )
 
         # 새로운 공지사항을 MongoDB에 저장
         saved_count = 0
@@ -147,16 +200,12 @@ def parse_notice_from_element(element, kst) -> Dict[str, Any]:
         title = title_element.get_text(strip=True)
 
         # 날짜 추출 - 일반 게시물과 공지사항 처리 방식이 다름
-        if is_notice:
-            # 공지사항은 상세 페이지에서 날짜를 가져와야 함
-            published = get_date_from_detail_page(link, kst)
-        else:
+        # 상세 페이지가 필요한 경우 published=None으로 두고 호출부에서 일괄 요청
+        published = None
+        if not is_notice:
             # 일반 게시물은 목록에서 날짜 추출
             date_element = element.select_one("div.board_etc span:first-child")
-            if not date_element:
-                # 날짜를 찾을 수 없는 경우 상세 페이지에서 가져옴
-                published = get_date_from_detail_page(link, kst)
-            else:
+            if date_element:
                 date_str = date_element.get_text(strip=True)
                 try:
                     # YYYY.MM.DD 형식
@@ -171,7 +220,7 @@ def parse_notice_from_element(element, kst) -> Dict[str, Any]:
                         )
                     except ValueError:
                         # 날짜 형식이 다른 경우 상세 페이지에서 가져옴
-                        published = get_date_from_detail_page(link, kst)
+                        published = None
 
         # 공지사항인 경우 제목 앞에 [공지] 표시 추가
         if is_notice and not title.startswith("[공지]"):
@@ -180,7 +229,7 @@ def parse_notice_from_element(element, kst) -> Dict[str, Any]:
         result = {
             "title": title,
             "link": link,
-            "published": published.isoformat(),
+            "published": published,
             "scraper_type": "university_contestevent",
         }
 
@@ -191,30 +240,59 @@ def parse_notice_from_element(element, kst) -> Dict[str, Any]:
         return None
 
 
-def get_date_from_detail_page(url: str, kst) -> datetime:
-    """상세 페이지에서 날짜 정보를 추출합니다."""
-    try:
-        soup = fetch_page(url)
+async def fetch_detail_dates(links: List[str], kst) -> Dict[str, datetime]:
+    """상세 페이지들을 동시에 가져와 {링크: 작성일} 매핑을 반환합니다.
+
+    같은 링크가 목록에 여러 번 나와도 한 번만 요청하고, 이전 호출에서
+    확인한 작성일은 캐시에서 바로 반환합니다.
+    """
 
+    detail_dates = {
+        link: _detail_date_cache[link] for link in links if link in _detail_date_cache
+    }
+    pending_links = list(dict.fromkeys(link for link in links if link not in detail_dates))
+    if not pending_links:
+        return detail_dates
+
+    # 모듈 단위 세션 재사용 - 핸들러마다 만들고 닫지 않음
+    session = get_session()
+    soups = await asyncio.gather(
+        *[fetch_page_async(session, link) for link in pending_links],
+        return_exceptions=True,
+    )
+
+    for link, soup in zip(pending_links, soups):
+        if isinstance(soup, Exception):
+            print(f"❌ [DETAIL] 상세 페이지 요청 중 오류: {soup}")
+            continue
+        published = parse_date_from_detail_soup(soup, kst, link)
+        detail_dates[link] = published
+        _detail_date_cache[link] = published
+    return detail_dates
+
+
+def parse_date_from_detail_soup(soup, kst, url: str) -> datetime:
+    """상세 페이지 soup에서 날짜 정보를 추출합니다."""
+    try:
         # 상세 페이지에서 날짜 요소 찾기 - view_top > board_etc > 작성일 span
         date_element = soup.select_one("div.view_top div.board_etc span:first-child")
         if not date_element:
             print(f"⚠️ [DETAIL] 상세 페이지에서 날짜 요소를 찾을 수 없음: {url}")
-            return datetime.now(kst)
+            return datetime.now(KST)
 
         date_str = date_element.get_text(strip=True)
         # "작성일 2025.03.07" 형식에서 날짜만 추출
-        date_match = re.search(r"작성일\s+(\d{4}[-\.]\d{1,2}[-\.]\d{1,2})", date_str)
+        date_match = _WRITE_DATE_RE.search(date_str)
         if date_match:
             date_str = date_match.group(1)
         else:
             # 다른 형식일 수 있으므로 일반적인 날짜 패턴 검색
-            date_match = re.search(r"(\d{4}[-\.]\d{1,2}[-\.]\d{1,2})", date_str)
+            date_match = _GEN_DATE_RE.search(date_str)
             if date_match:
                 date_str = date_match.group(1)
             else:
                 print(f"⚠️ [DETAIL] 날짜 형식을 인식할 수 없음: {date_str}")
-                return datetime.now(kst)
+                return datetime.now(KST)
 
         try:
             # YYYY.MM.DD 형식
@@ -225,7 +303,7 @@ def get_date_from_detail_page(url: str, kst) -> datetime:
                 return datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=kst)
         except ValueError as e:
             print(f"❌ [DETAIL] 날짜 파싱 오류: {date_str}, {e}")
-            return datetime.now(kst)
+            return datetime.now(KST)
     except Exception as e:
-        print(f"❌ [DETAIL] 상세 페이지 요청 중 오류: {e}")
-        return datetime.now(kst)
+        print(f"❌ [DETAIL] 상세 페이지 파싱 중 오류: {e}")
+        return datetime.now(KST)
@@ -1,5 +1,10 @@
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import pytz
+import soupsieve
+from bs4 import SoupStrainer
 from typing import Dict, Any
 from common_utils import (
     fetch_page,
@@ -8,6 +13,21 @@ from common_utils import (
     send_slack_notification,
 )
 
+# 행 단위 로그는 DEBUG로 낮춰 CloudWatch 출력 비용을 줄임
+logger = logging.getLogger(__name__)
+
+# CSS 셀렉터는 모듈 로드 시 1회만 컴파일
+_ROW_SEL = soupsieve.compile(".list-tbody ul")
+_SUBJECT_SEL = soupsieve.compile(".subject a")
+_DATE_SEL = soupsieve.compile(".date")
+
+# 타임존 객체는 모듈 로드 시 1회만 생성
+KST = pytz.timezone("Asia/Seoul")
+
+# 날짜 파싱에 쓰이는 정규식 (모듈 로드 시 1회 컴파일)
+# YYYY-MM-DD / YYYY.MM.DD / YY.MM.DD 형식을 한 번에 판별
+_DATE_RE = re.compile(r"(\d{2}|\d{4})[-.](\d{1,2})[-.](\d{1,2})")
+
 
 def handler(event, context):
     """
@@ -40,50 +60,59 @@ def scrape_university_scholarship() -> Dict[str, Any]:
     """
 
     url = "https://cs.kookmin.ac.kr/news/kookmin/scholarship/"
-    kst = pytz.timezone("Asia/Seoul")
 
     print(f"🌐 [SCRAPER] 스크래핑 시작 - URL: {url}")
 
     try:
-        # 웹페이지 가져오기
-        soup = fetch_page(url)
+        # 웹페이지와 기존 공지사항 조회는 서로 독립적이므로 동시에 실행
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            soup_future = executor.submit(
+                fetch_page, url, strainer=SoupStrainer(class_="list-tbody")
+            )
+            recent_future = executor.submit(get_recent_notices, "university_scholarship")
+            soup = soup_future.result()
+            recent_notices = recent_future.result()
 
         # 공지사항 목록 요소들 가져오기
-        elements = soup.select(".list-tbody ul")
+        elements = _ROW_SEL.select(soup)
         print(f"📊 [SCRAPER] 발견된 공지사항 수: {len(elements)}")
-
         # 기존 공지사항 확인 (MongoDB에서)
-        recent_notices = get_recent_notices("university_scholarship")
-        recent_links = {notice.get("link") for notice in recent_notices}
-        recent_titles = {notice.get("title") for notice in recent_notices}
+        # 링크/제목을 한 집합에 넣어 중복 확인을 해시 조회 1회로 줄임
+        recent_keys = {notice.get("link") for notice in recent_notices}
+        recent_keys.update(notice.get("title") for notice in recent_notices)
 
         # 새로운 공지사항 파싱
+        # 30일 이내의 데이터만 필터링 (기준 시각은 루프 동안 변하지 않음)
+        thirty_days_ago = datetime.now(KST) - timedelta(days=30)
         new_notices = []
+        duplicate_count = 0
+        too_old_count = 0
 
         for element in elements:
-            notice = parse_notice_from_element(element, kst)
+            # 제목/링크만 먼저 뽑아 중복이면 날짜 파싱 전에 건너뜀
+            key = extract_notice_key(element)
+            if not key:
+                continue
+            title, link = key
+            if link in recent_keys or title in recent_keys:
+                duplicate_count += 1
+                continue
+
+            notice = parse_notice_from_element(element, KST, title, link)
             if notice:
-                # 30일 이내의 데이터만 필터링
-                thirty_days_ago = datetime.now(kst) - timedelta(days=30)
-                published_date = datetime.fromisoformat(
-                    notice["published"].replace("Z", "+00:00")
-                )
-                if published_date >= thirty_days_ago:
-                    # 중복 확인
-                    if (
-                        notice["link"] not in recent_links
-                        and notice["title"] not in recent_titles
-                    ):
-                        new_notices.append(notice)
-                        print(
-                            f"🆕 [SCRAPER] 새로운 공지사항: {notice['title'][:30]}..."
-                        )
-                else:
-                    print(
-                        f"⏰ [SCRAPER] 30일 이전 공지사항 제외: {notice['title'][:30]}..."
+                # published는 datetime 그대로 저장됨 (BSON date)
+                if notice["published"] >= thirty_days_ago:
+                    new_notices.append(notice)
+                    logger.debug(
+                        "🆕 [SCRAPER] 새로운 공지사항: %s...", notice["title"][:30]
                     )
+                else:
+                    too_old_count += 1
 
-        print(f"📈 [SCRAPER] 새로운 공지사항 수: {len(new_notices)}")
+        print(
+            f"📈 [SCRAPER] 새로운 공지사항 수: {len(new_notices)} "
+            f"(중복: {duplicate_count}개, 30일 이전: {too_old_count}개)"
+        )
 
         # 새로운 공지사항을 MongoDB에 저장
         saved_count = 0
@@ -110,45 +139,50 @@ def scrape_university_scholarship() -> Dict[str, Any]:
         return {"success": False, "error": error_msg}
 
 
-def parse_notice_from_element(element, kst) -> Dict[str, Any]:
-    """HTML 요소에서 장학공지 정보를 추출"""
+def extract_notice_key(element):
+    """행에서 중복 확인에 필요한 제목/링크만 추출"""
 
     try:
-        # 공지사항 여부 확인
-        is_notice = element.select_one(".notice") is not None
-
-        # 제목과 링크 추출
-        title_element = element.select_one(".subject a")
+        title_element = _SUBJECT_SEL.select_one(element)
         if not title_element:
             return None
 
         title = title_element.get_text(strip=True)
         relative_link = title_element.get("href", "")
         link = f"https://cs.kookmin.ac.kr/news/kookmin/scholarship/{relative_link}"
+        return title, link
+
+    except Exception as e:
+        print(f"❌ [PARSE] 공지사항 키 추출 중 오류: {e}")
+        return None
 
+
+def parse_notice_from_element(element, kst, title: str, link: str) -> Dict[str, Any]:
+    """HTML 요소에서 장학공지 정보를 추출 (키 추출 이후의 날짜 파싱)"""
+
+    try:
         # 날짜 추출
-        date_element = element.select_one(".date")
+        date_element = _DATE_SEL.select_one(element)
         if not date_element:
             return None
 
         date_str = date_element.get_text(strip=True)
 
-        # 다양한 날짜 형식 처리
-        try:
-            # YYYY-MM-DD 형식
+        # 다양한 날짜 형식 처리 - 정규식 한 번으로 판별해 예외 없이 생성
+        date_match = _DATE_RE.fullmatch(date_str)
+        if date_match:
+            year, month, day = map(int, date_match.groups())
+            if year < 100:
+                year += 2000  # 2000년대로 가정
+            published = datetime(year, month, day, tzinfo=kst)
+        else:
+            # 예상 밖의 형식은 기존 strptime 경로로 폴백
             published = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=kst)
-        except ValueError:
-            try:
-                # YYYY.MM.DD 형식
-                published = datetime.strptime(date_str, "%Y.%m.%d").replace(tzinfo=kst)
-            except ValueError:
-                # YY.MM.DD 형식
-                published = datetime.strptime(date_str, "%y.%m.%d").replace(tzinfo=kst)
 
         result = {
             "title": title,
             "link": link,
-            "published": published.isoformat(),
+            "published": published,
             "scraper_type": "university_scholarship",
         }
 
@@ -1,13 +1,24 @@
+import logging
 from datetime import datetime, timedelta
 import pytz
+import soupsieve
+from bs4 import SoupStrainer
 from typing import Dict, Any
 from common_utils import (
     fetch_page,
-    get_recent_notices,
+    find_existing_notices,
     save_notices_to_db,
     send_slack_notification,
 )
 
+# 행 단위 로그는 DEBUG로 낮춰 CloudWatch 출력 비용을 줄임
+logger = logging.getLogger(__name__)
+
+# CSS 셀렉터는 모듈 로드 시 1회만 컴파일
+_ROW_SEL = soupsieve.compile(".list-tbody .normal-bg, .list-tbody .notice-bg")
+_SUBJECT_SEL = soupsieve.compile(".subject a")
+_DATE_SEL = soupsieve.compile(".date")
+
 
 def handler(event, context):
     """
@@ -45,43 +56,53 @@ def scrape_university_speciallecture() -> Dict[str, Any]:
     print(f"🌐 [SCRAPER] 스크래핑 시작 - URL: {url}")
 
     try:
-        # 웹페이지 가져오기
-        soup = fetch_page(url)
+        # 웹페이지 가져오기 (필요한 list-tbody 부분 트리만 파싱)
+        soup = fetch_page(url, strainer=SoupStrainer(class_="list-tbody"))
 
         # 공지사항 목록 요소들 가져오기
-        elements = soup.select(".list-tbody .normal-bg, .list-tbody .notice-bg")
+        elements = _ROW_SEL.select(soup)
         print(f"📊 [SCRAPER] 발견된 공지사항 수: {len(elements)}")
 
-        # 기존 공지사항 확인 (MongoDB에서)
-        recent_notices = get_recent_notices("university_speciallecture")
-        recent_links = {notice.get("link") for notice in recent_notices}
-        recent_titles = {notice.get("title") for notice in recent_notices}
-
         # 새로운 공지사항 파싱
-        new_notices = []
+        # 30일 이내의 데이터만 필터링 (기준 시각은 루프 동안 변하지 않음)
+        thirty_days_ago = datetime.now(kst) - timedelta(days=30)
 
+        # 1차: 중복 확인에 쓰는 제목/링크 키만 추출
+        keyed_elements = []
         for element in elements:
-            notice = parse_notice_from_element(element, kst)
-            if notice:
-                # 30일 이내의 데이터만 필터링
-                thirty_days_ago = datetime.now(kst) - timedelta(days=30)
-                published_date = datetime.fromisoformat(
-                    notice["published"].replace("Z", "+00:00")
-                )
-                if published_date >= thirty_days_ago:
-                    # 중복 확인
-                    if (
-                        notice["link"] not in recent_links
-                        and notice["title"] not in recent_titles
-                    ):
+            key = extract_notice_key(element)
+            if key:
+                keyed_elements.append((element, key[0], key[1]))
+
+        # 중복 확인 - 최근 30일 창 전체 대신 이번 후보들만 $in으로 조회
+        new_notices = []
+        if keyed_elements:
+            existing = find_existing_notices(
+                "university_speciallecture",
+                [link for _, _, link in keyed_elements],
+                [title for _, title, _ in keyed_elements],
+            )
+            existing_keys = {doc.get("link") for doc in existing}
+            existing_keys.update(doc.get("title") for doc in existing)
+
+            # 2차: 중복이 아닌 행만 날짜까지 마저 파싱
+            for element, title, link in keyed_elements:
+                if link in existing_keys or title in existing_keys:
+                    continue
+
+                notice = parse_notice_from_element(element, kst, title, link)
+                if notice:
+                    # published는 datetime 그대로 저장됨 (BSON date)
+                    if notice["published"] >= thirty_days_ago:
                         new_notices.append(notice)
-                        print(
-                            f"🆕 [SCRAPER] 새로운 공지사항: {notice['title'][:30]}..."
+                        logger.debug(
+                            "🆕 [SCRAPER] 새로운 공지사항: %s...", notice["title"][:30]
+                        )
+                    else:
+                        logger.debug(
+                            "⏰ [SCRAPER] 30일 이전 공지사항 제외: %s...",
+                            notice["title"][:30],
                         )
-                else:
-                    print(
-                        f"⏰ [SCRAPER] 30일 이전 공지사항 제외: {notice['title'][:30]}..."
-                    )
 
         print(f"📈 [SCRAPER] 새로운 공지사항 수: {len(new_notices)}")
 
@@ -110,39 +131,48 @@ def scrape_university_speciallecture() -> Dict[str, Any]:
         return {"success": False, "error": error_msg}
 
 
-def parse_notice_from_element(element, kst) -> Dict[str, Any]:
-    """HTML 요소에서 특강공지 정보를 추출"""
+def extract_notice_key(element):
+    """행에서 중복 확인에 필요한 제목/링크만 추출
 
-    try:
-        # 공지사항 여부 확인
-        is_notice = "notice-bg" in element.get("class", [])
+    상단 고정 공지는 저장 시 제목에 [공지]가 붙으므로 키에도 동일하게
+    반영해 DB의 제목과 비교할 수 있게 합니다.
+    """
 
-        # 제목과 링크 추출
-        title_tag = element.select_one(".subject a")
+    try:
+        title_tag = _SUBJECT_SEL.select_one(element)
         if not title_tag:
             return None
 
         title = title_tag.text.strip()
+        if "notice-bg" in element.get("class", []) and not title.startswith("[공지]"):
+            title = f"[공지] {title}"
+
         link = title_tag["href"]
         if not link.startswith("http"):
             link = f"https://cs.kookmin.ac.kr/news/kookmin/special_lecture/{link}"
+        return title, link
+
+    except Exception as e:
+        print(f"❌ [PARSE] 공지사항 키 추출 중 오류: {e}")
+        return None
 
+
+def parse_notice_from_element(element, kst, title: str, link: str) -> Dict[str, Any]:
+    """HTML 요소에서 특강공지 정보를 추출 (키 추출 이후의 날짜 파싱)"""
+
+    try:
         # 날짜 추출
-        date_element = element.select_one(".date")
+        date_element = _DATE_SEL.select_one(element)
         if not date_element:
             return None
 
         date_str = date_element.text.strip()
         published = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=kst)
 
-        # 공지사항인 경우 제목 앞에 [공지] 표시 추가
-        if is_notice and not title.startswith("[공지]"):
-            title = f"[공지] {title}"
-
         result = {
             "title": title,
             "link": link,
-            "published": published.isoformat(),
+            "published": published,
             "scraper_type": "university_speciallecture",
         }
 
@@ -1,15 +1,42 @@
-import json
+import hashlib
+import logging
+import orjson
 import boto3
+import botocore.config
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from master_utils import (
     send_master_handler_error_notification,
     load_scraper_types,
     load_scraper_categories,
     save_scraper_categories_to_db,
     save_scraper_types_to_db,
-    find_category_by_scraper_type,
 )
 
+# boto3 클라이언트는 생성 비용이 크므로 모듈 로드 시 1회만 생성해 재사용
+# (urllib3 연결 풀을 스레드 풀 크기에 맞추고, 재시도는 2회로 제한)
+LAMBDA_CLIENT = boto3.client(
+    "lambda",
+    config=botocore.config.Config(
+        max_pool_connections=10,
+        retries={"max_attempts": 2, "mode": "standard"},
+    ),
+)
+
+# Lambda 함수 목록은 거의 바뀌지 않으므로 워밍된 컨테이너에서 재사용
+_FUNCTION_LIST_CACHE = {"expires_at": 0.0, "functions": None}
+FUNCTION_LIST_TTL_SECONDS = 300
+
+# 마지막으로 DB에 저장한 메타데이터 해시 (내용이 같으면 저장 생략)
+_metadata_save_hash = None
+
+# 스크래퍼 호출 페이로드는 항상 비어 있으므로 직렬화 없이 상수로 재사용
+EMPTY_PAYLOAD = b"{}"
+
+# 스크래퍼 단위 로그는 DEBUG로 낮춰 CloudWatch 출력 비용을 줄임
+logger = logging.getLogger(__name__)
+
 
 def handler(event, context):
     """
@@ -50,7 +77,7 @@ def handler(event, context):
         )
         return {
             "statusCode": 200,
-            "body": json.dumps(result, ensure_ascii=False, default=str),
+            "body": orjson.dumps(result, default=str).decode(),
         }
 
     except Exception as e:
@@ -59,13 +86,12 @@ def handler(event, context):
         send_master_handler_error_notification("handler", error_msg)
         return {
             "statusCode": 500,
-            "body": json.dumps(
+            "body": orjson.dumps(
                 {
                     "error": "Master Lambda Handler 실행 중 오류가 발생했습니다.",
                     "details": str(e),
-                },
-                ensure_ascii=False,
-            ),
+                }
+            ).decode(),
         }
 
 
@@ -86,34 +112,33 @@ def validate_and_save_scrapers():
             "success": False,
             "response": {
                 "statusCode": 500,
-                "body": json.dumps(
-                    {"error": "스크래퍼 설정 파일을 로드할 수 없습니다."},
-                    ensure_ascii=False,
-                ),
+                "body": orjson.dumps(
+                    {"error": "스크래퍼 설정 파일을 로드할 수 없습니다."}
+                ).decode(),
             },
         }
 
     print(f"📊 [MASTER] 로드된 스크래퍼 타입: {len(scraper_types)}개")
     print(f"📊 [MASTER] 로드된 스크래퍼 카테고리: {len(scraper_categories)}개")
 
-    # 2. Lambda 함수 목록 가져오기
-    print("🔍 [MASTER] Lambda 함수 목록 조회")
-    lambda_client = boto3.client("lambda")
-    response = lambda_client.list_functions()
-    all_functions = response["Functions"]
-
-    # 추가 페이지가 있는 경우 계속 가져오기
-    while "NextMarker" in response:
-        response = lambda_client.list_functions(Marker=response["NextMarker"])
-        all_functions.extend(response["Functions"])
-
-    # 3. 현재 stage에 해당하는 scraper 함수들만 필터링
-    scraper_functions = [
-        func["FunctionName"]
-        for func in all_functions
-        if func["FunctionName"].endswith("scraper")
-        and func["FunctionName"].startswith(f"{current_stage}-")
-    ]
+    # 2. 현재 stage의 스크래퍼 함수 목록 가져오기 (TTL 내에는 캐시 재사용)
+    # stage는 배포된 컨테이너에서 불변이므로 필터링된 이름 목록을 그대로 캐시
+    scraper_functions = _FUNCTION_LIST_CACHE["functions"]
+    if scraper_functions is None or _FUNCTION_LIST_CACHE["expires_at"] < time.time():
+        print("🔍 [MASTER] Lambda 함수 목록 조회")
+        # 페이지 순회와 이름 필터링 모두 botocore(JMESPath)가 담당
+        paginator = LAMBDA_CLIENT.get_paginator("list_functions")
+        scraper_functions = list(
+            paginator.paginate(PaginationConfig={"PageSize": 50}).search(
+                f"Functions[?starts_with(FunctionName, '{current_stage}-')"
+                " && ends_with(FunctionName, 'scraper')].FunctionName"
+            )
+        )
+
+        _FUNCTION_LIST_CACHE["functions"] = scraper_functions
+        _FUNCTION_LIST_CACHE["expires_at"] = time.time() + FUNCTION_LIST_TTL_SECONDS
+    else:
+        print("🔍 [MASTER] Lambda 함수 목록 캐시 사용")
 
     print(
         f"📋 [MASTER] 발견된 스크래퍼 Lambda 함수 ({current_stage}): {len(scraper_functions)}개"
@@ -129,11 +154,33 @@ def validate_and_save_scrapers():
         f"❌ [MASTER] 유효하지 않은 스크래퍼: {len(scraper_functions) - len(valid_scrapers)}개"
     )
 
-    # 5. 유효한 스크래퍼 정보를 DB에 저장
-    print("💾 [MASTER] 스크래퍼 메타데이터 DB 저장 시작")
-    save_scraper_categories_to_db(scraper_categories)
-    save_scraper_types_to_db(scraper_types, valid_scrapers)
-    print("💾 [MASTER] 스크래퍼 메타데이터 DB 저장 완료")
+    # 5. 유효한 스크래퍼 정보를 DB에 저장 (내용이 바뀐 경우에만)
+    global _metadata_save_hash
+    metadata_hash = hashlib.blake2b(
+        orjson.dumps(
+            [scraper_types, scraper_categories, valid_scrapers],
+            option=orjson.OPT_SORT_KEYS,
+        ),
+        digest_size=16,
+    ).hexdigest()
+
+    if metadata_hash != _metadata_save_hash:
+        print("💾 [MASTER] 스크래퍼 메타데이터 DB 저장 시작")
+        # 두 저장은 서로 독립적이므로 동시에 실행
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            categories_future = executor.submit(
+                save_scraper_categories_to_db, scraper_categories
+            )
+            types_future = executor.submit(
+                save_scraper_types_to_db, scraper_types, valid_scrapers
+            )
+            categories_saved = categories_future.result()
+            types_saved = types_future.result()
+        if categories_saved and types_saved:
+            _metadata_save_hash = metadata_hash
+        print("💾 [MASTER] 스크래퍼 메타데이터 DB 저장 완료")
+    else:
+        print("💾 [MASTER] 메타데이터 변경 없음 - DB 저장 건너뜀")
 
     return {
         "success": True,
@@ -143,46 +190,32 @@ def validate_and_save_scrapers():
 
 
 def invoke_scrapers(valid_scrapers):
-    """유효한 스크래퍼 함수들을 비동기로 호출합니다."""
+    """유효한 스크래퍼 함수들을 비동기로 호출합니다.
 
-    lambda_client = boto3.client("lambda")
-    success_count = 0
-    error_count = 0
-    invocation_results = []
-    print(f"🚀 [MASTER] {len(valid_scrapers)}개 스크래퍼 함수 호출 시작")
+    invoke(Event)는 호출 자체가 HTTPS 왕복이므로 직렬 루프 대신
+    스레드 풀 하나(max_workers=10)에 전부 제출해 동시에 호출합니다.
+    배치 단위로 풀을 새로 만들면 배치마다 가장 느린 호출을 기다리게
+    되므로, 풀 하나가 작업 큐에서 바로바로 가져가게 합니다.
+    """
 
-    for function_name in valid_scrapers:
-        try:
-            # 개별 스크래퍼 Lambda 함수 비동기 호출
-            lambda_client.invoke(
-                FunctionName=function_name,
-                InvocationType="Event",  # 비동기 호출
-                Payload=json.dumps({}),
-            )
+    print(f"🚀 [MASTER] {len(valid_scrapers)}개 스크래퍼 함수 호출 시작")
 
-            success_count += 1
-            invocation_results.append(
-                {
-                    "function_name": function_name,
-                    "status": "success",
-                    "message": "비동기 호출 성공",
-                }
-            )
+    # 완료 순서에 따라 append하는 대신 제출 순서대로 자리를 미리 잡아두고
+    # 인덱스로 기록 - 결과 순서가 결정적이고 리스트 재할당도 없음
+    results = [None] * len(valid_scrapers)
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        future_to_index = {
+            executor.submit(call_single_lambda, function_name): index
+            for index, function_name in enumerate(valid_scrapers)
+        }
+        for future in as_completed(future_to_index):
+            results[future_to_index[future]] = future.result()
 
-        except Exception as e:
-            error_count += 1
-            error_msg = f"Lambda 함수 {function_name} 호출 실패: {str(e)}"
-            print(f"❌ [INVOKE] {error_msg}")
-            send_master_handler_error_notification(
-                "invoke_lambda", error_msg, f"함수명: {function_name}"
-            )
-            invocation_results.append(
-                {
-                    "function_name": function_name,
-                    "status": "error",
-                    "message": str(e),
-                }
-            )
+    # 성공(None)은 카운트로만 남기고 응답에는 실패 항목만 담음
+    # (성공 로그는 CloudWatch에 이미 남으므로 N개의 '성공' 엔트리 직렬화를 생략)
+    invocation_results = [result for result in results if result is not None]
+    error_count = len(invocation_results)
+    success_count = len(valid_scrapers) - error_count
 
     return {
         "total_scrapers": len(valid_scrapers),
@@ -192,6 +225,35 @@ def invoke_scrapers(valid_scrapers):
     }
 
 
+def call_single_lambda(function_name):
+    """스크래퍼 Lambda 함수 하나를 비동기(Event)로 호출합니다.
+
+    boto3 클라이언트는 invoke에 한해 스레드 안전하므로 모듈 수준의
+    LAMBDA_CLIENT를 그대로 공유합니다. 성공은 None을 반환하고
+    실패한 경우에만 에러 정보를 담은 dict를 반환합니다.
+    """
+
+    try:
+        LAMBDA_CLIENT.invoke(
+            FunctionName=function_name,
+            InvocationType="Event",  # 비동기 호출
+            Payload=EMPTY_PAYLOAD,
+        )
+        return None
+
+    except Exception as e:
+        error_msg = f"Lambda 함수 {function_name} 호출 실패: {str(e)}"
+        print(f"❌ [INVOKE] {error_msg}")
+        send_master_handler_error_notification(
+            "invoke_lambda", error_msg, f"함수명: {function_name}"
+        )
+        return {
+            "function_name": function_name,
+            "status": "error",
+            "message": str(e),
+        }
+
+
 def validate_scrapers(scraper_functions, scraper_types, scraper_categories):
     """
     스크래퍼 Lambda 함수들이 유효한지 검증합니다.
@@ -206,11 +268,19 @@ def validate_scrapers(scraper_functions, scraper_types, scraper_categories):
     """
     current_stage = os.environ.get("STAGE", "dev")
     valid_scrapers = []
+    # 리스트 멤버십 검사는 O(N)이므로 집합으로 한 번만 변환
+    scraper_function_set = frozenset(scraper_functions)
+    # 타입별 카테고리 역인덱스를 한 번만 만들어 타입마다의 선형 탐색을 제거
+    type_to_category = {
+        scraper_type: category_name
+        for category_name, category_info in scraper_categories.items()
+        for scraper_type in category_info.get("scraper_types", [])
+    }
 
     # JSON에 정의된 스크래퍼 타입들을 순회하면서 해당하는 Lambda 함수가 존재하는지 확인
     for scraper_type, scraper_info in scraper_types.items():
         # 1. 스크래퍼 타입이 어떤 카테고리에 속하는지 확인
-        category = find_category_by_scraper_type(scraper_type, scraper_categories)
+        category = type_to_category.get(scraper_type)
         if not category:
             print(
                 f"❌ [VALIDATE] 카테고리를 찾을 수 없는 스크래퍼 타입: {scraper_type}"
@@ -229,7 +299,7 @@ def validate_scrapers(scraper_functions, scraper_types, scraper_categories):
         expected_function_name = f"{current_stage}-{base_function_name}"
 
         # 실제 Lambda 함수 이름 확인
-        if expected_function_name not in scraper_functions:
+        if expected_function_name not in scraper_function_set:
             print(
                 f"❌ [VALIDATE] Lambda 함수가 존재하지 않는 스크래퍼 타입: {scraper_type} (예상: {expected_function_name}, 기본: {base_function_name})"
             )
@@ -237,8 +307,12 @@ def validate_scrapers(scraper_functions, scraper_types, scraper_categories):
 
         matching_function = expected_function_name
 
-        print(
-            f"✅ [VALIDATE] 유효한 스크래퍼 ({current_stage}): {matching_function} ({scraper_type} -> {category})"
+        logger.debug(
+            "✅ [VALIDATE] 유효한 스크래퍼 (%s): %s (%s -> %s)",
+            current_stage,
+            matching_function,
+            scraper_type,
+            category,
         )
         valid_scrapers.append(matching_function)
 
@@ -1,15 +1,41 @@
-import json
+import logging
+import orjson
 import os
+import threading
 from datetime import datetime
-from pymongo import MongoClient
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
+
+# pymongo/slack_sdk는 임포트 비용이 커서 실제로 쓰는 함수 안에서 지연 임포트
+# (메타데이터가 캐시돼 DB 저장을 건너뛰는 워밍 호출은 임포트 비용을 내지 않음)
+
+# 항목 단위 로그는 DEBUG로 낮춰 CloudWatch 출력 비용을 줄임
+logger = logging.getLogger(__name__)
 
 
 def send_master_handler_error_notification(
     function_name: str, error: str, additional_info: str = None
 ) -> bool:
-    """master_handler.py에서 발생한 에러를 위한 전용 알림 함수"""
+    """master_handler.py에서 발생한 에러를 위한 전용 알림 함수
+
+    Slack API 왕복이 에러 경로의 핸들러 실행을 막지 않도록 실제 전송은
+    데몬 스레드로 넘기고 바로 반환합니다. 핸들러의 남은 실행 시간 동안
+    전송이 병렬로 진행됩니다.
+    """
+
+    threading.Thread(
+        target=_send_master_handler_error_notification,
+        args=(function_name, error, additional_info),
+        daemon=True,
+    ).start()
+    return True
+
+
+def _send_master_handler_error_notification(
+    function_name: str, error: str, additional_info: str = None
+) -> bool:
+    """Slack 에러 알림을 실제로 전송합니다. (백그라운드 스레드에서 실행)"""
+
+    from slack_sdk import WebClient
+    from slack_sdk.errors import SlackApiError
 
     try:
         slack_token = os.environ.get("SLACK_BOT_TOKEN")
@@ -43,12 +69,21 @@ def send_master_handler_error_notification(
         return False
 
 
+# 메타데이터 JSON은 배포 패키지에 고정되어 있으므로 프로세스당 1회만 파싱
+_scraper_types_cache = None
+_scraper_categories_cache = None
+
+
 def load_scraper_types():
-    """스크래퍼 타입 JSON 파일을 로드합니다."""
+    """스크래퍼 타입 JSON 파일을 로드합니다. (프로세스 단위 캐시)"""
+    global _scraper_types_cache
+    if _scraper_types_cache is not None:
+        return _scraper_types_cache
     try:
-        with open("metadata/scraper_types.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("scraper_types", {})
+        with open("metadata/scraper_types.json", "rb") as f:
+            data = orjson.loads(f.read())
+            _scraper_types_cache = data.get("scraper_types", {})
+            return _scraper_types_cache
     except Exception as e:
         error_msg = f"스크래퍼 타입 파일 로드 실패: {e}"
         print(f"❌ [LOAD] {error_msg}")
@@ -57,11 +92,15 @@ def load_scraper_types():
 
 
 def load_scraper_categories():
-    """스크래퍼 카테고리 JSON 파일을 로드합니다."""
+    """스크래퍼 카테고리 JSON 파일을 로드합니다. (프로세스 단위 캐시)"""
+    global _scraper_categories_cache
+    if _scraper_categories_cache is not None:
+        return _scraper_categories_cache
     try:
-        with open("metadata/scraper_categories.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("scraper_categories", {})
+        with open("metadata/scraper_categories.json", "rb") as f:
+            data = orjson.loads(f.read())
+            _scraper_categories_cache = data.get("scraper_categories", {})
+            return _scraper_categories_cache
     except Exception as e:
         error_msg = f"스크래퍼 카테고리 파일 로드 실패: {e}"
         print(f"❌ [LOAD] {error_msg}")
@@ -69,18 +108,30 @@ def load_scraper_categories():
         return {}
 
 
+# MongoClient는 자체 연결 풀을 가지므로 컨테이너당 1개만 만들어 재사용
+_mongo_client = None
+
+
 def get_database(db_name: str = None):
-    """MongoDB 데이터베이스 연결을 반환합니다."""
+    """MongoDB 데이터베이스 연결을 반환합니다. (클라이언트는 컨테이너 단위 재사용)"""
+    global _mongo_client
     try:
+        from pymongo import MongoClient
+
         mongodb_uri = os.environ.get("MONGODB_URI")
         if not mongodb_uri:
             print("❌ [DB] MongoDB URI가 설정되지 않았습니다")
             return None
 
-        client = MongoClient(mongodb_uri)
+        if _mongo_client is None:
+            _mongo_client = MongoClient(
+                mongodb_uri,
+                maxPoolSize=10,
+                serverSelectionTimeoutMS=3000,
+            )
         default_db = "dev-kookmin-feed"
         db_name = db_name or os.environ.get("DB_NAME") or default_db
-        return client[db_name]
+        return _mongo_client[db_name]
     except Exception as e:
         error_msg = f"DB 연결 중 오류 발생: {e}"
         print(f"❌ [DB] {error_msg}")
@@ -99,6 +150,8 @@ def get_collection(db_name: str = None, collection_name: str = None):
 def save_scraper_categories_to_db(scraper_categories):
     """ScraperCategory 데이터를 DB에 저장합니다."""
     try:
+        from pymongo import UpdateOne
+
         collection = get_collection(
             db_name="scraper-metadata", collection_name="scraper-categories"
         )
@@ -106,8 +159,9 @@ def save_scraper_categories_to_db(scraper_categories):
             print("❌ [DB] 컬렉션을 가져올 수 없습니다")
             return False
 
-        for category_name, category_info in scraper_categories.items():
-            collection.update_one(
+        # 업서트를 한 번의 bulk_write로 묶어 카테고리 수만큼의 왕복을 1회로 줄임
+        operations = [
+            UpdateOne(
                 {"name": category_name},
                 {
                     "$set": {
@@ -117,6 +171,10 @@ def save_scraper_categories_to_db(scraper_categories):
                 },
                 upsert=True,
             )
+            for category_name, category_info in scraper_categories.items()
+        ]
+        if operations:
+            collection.bulk_write(operations, ordered=False)
         print("✅ [DB] ScraperCategory 저장 또는 업데이트 완료")
         return True
     except Exception as e:
@@ -131,6 +189,8 @@ def save_scraper_categories_to_db(scraper_categories):
 def save_scraper_types_to_db(scraper_types, valid_scrapers):
     """유효한 스크래퍼 타입들을 DB에 저장합니다."""
     try:
+        from pymongo import UpdateOne
+
         collection = get_collection(
             db_name="scraper-metadata", collection_name="scraper-types"
         )
@@ -138,9 +198,11 @@ def save_scraper_types_to_db(scraper_types, valid_scrapers):
             print("❌ [DB] 컬렉션을 가져올 수 없습니다")
             return False
 
-        saved_count = 0
         current_stage = os.environ.get("STAGE", "dev")
+        valid_scraper_set = set(valid_scrapers)
 
+        # 업서트를 모았다가 한 번의 bulk_write로 전송 (타입 수만큼의 왕복 제거)
+        operations = []
         for scraper_type, scraper_info in scraper_types.items():
             # 유효한 스크래퍼만 저장
 
@@ -148,32 +210,36 @@ def save_scraper_types_to_db(scraper_types, valid_scrapers):
             base_function_name = scraper_info.get("scraper_lambda_function_name")
             if base_function_name:
                 expected_function_name = f"{current_stage}-{base_function_name}"
-                print(f"예상 함수명: {expected_function_name}")
-
-                if expected_function_name in valid_scrapers:
-                    collection.update_one(
-                        {"collection_name": scraper_type.lower()},
-                        {
-                            "$set": {
-                                "type_name": scraper_type,
-                                "korean_name": scraper_info.get("korean_name", ""),
-                                "url": scraper_info.get("url", ""),
-                                "scraper_class_name": scraper_info.get(
-                                    "scraper_class_name", ""
-                                ),
-                                "scraper_lambda_function_name": scraper_info.get(
-                                    "scraper_lambda_function_name", ""
-                                ),
-                            }
-                        },
-                        upsert=True,
+                logger.debug("예상 함수명: %s", expected_function_name)
+
+                if expected_function_name in valid_scraper_set:
+                    operations.append(
+                        UpdateOne(
+                            {"collection_name": scraper_type.lower()},
+                            {
+                                "$set": {
+                                    "type_name": scraper_type,
+                                    "korean_name": scraper_info.get("korean_name", ""),
+                                    "url": scraper_info.get("url", ""),
+                                    "scraper_class_name": scraper_info.get(
+                                        "scraper_class_name", ""
+                                    ),
+                                    "scraper_lambda_function_name": scraper_info.get(
+                                        "scraper_lambda_function_name", ""
+                                    ),
+                                }
+                            },
+                            upsert=True,
+                        )
                     )
-                    saved_count += 1
-                    print(
-                        f"✅ [DB] ScraperType 저장: {scraper_info.get('korean_name', '')}"
+                    logger.debug(
+                        "✅ [DB] ScraperType 저장: %s", scraper_info.get("korean_name", "")
                     )
 
-        print(f"✅ [DB] ScraperType 저장 또는 업데이트 완료: {saved_count}개")
+        if operations:
+            collection.bulk_write(operations, ordered=False)
+
+        print(f"✅ [DB] ScraperType 저장 또는 업데이트 완료: {len(operations)}개")
         return True
     except Exception as e:
         error_msg = f"ScraperType 저장 또는 업데이트 중 오류 발생: {e}"